@@ -1,5 +1,84 @@
 import random
-import argparse
+from functools import lru_cache
+
+_EMOTIONS = ["angry", "anxious", "calm", "nervous", "remorseful", "defensive", "distraught"]
+_ACTIONS = [
+    "shouted at the officer",
+    "refused to cooperate",
+    "apologized repeatedly",
+    "blamed his partner",
+    "explained the plan calmly",
+    "avoided eye contact",
+    "sobbed quietly",
+]
+_MOTIVES = [
+    "needed money",
+    "wanted revenge",
+    "acted impulsively",
+    "was pressured by peers",
+    "was afraid of consequences",
+    "wanted recognition",
+    "felt cornered",
+]
+
+_SITUATIONS = [
+    "the interrogation room",
+    "the transport after arrest",
+    "when shown the evidence",
+    "the courtroom hallway",
+    "the holding cell",
+]
+
+_INTRO_TEMPLATES = [
+    "The following is the recorded statement given by the suspect during questioning.",
+    "The suspect provided the following account over the course of the interview.",
+    "Below is a summary of the suspect's remarks captured during the interview session.",
+]
+
+_CLOSING_TEMPLATES = [
+    "The tone of the suspect's voice and body language suggested complex emotions throughout.",
+    "Overall, the suspect's account contained inconsistencies and signs of stress.",
+    "The recorded account was logged and appended to the case file for further review.",
+]
+
+
+def _event_paragraph(rng):
+    """One cohesive event paragraph drawn from the given random source."""
+    situation = rng.choice(_SITUATIONS)
+    emotion = rng.choice(_EMOTIONS)
+    action = rng.choice(_ACTIONS)
+    motive = rng.choice(_MOTIVES)
+
+    # A few sentences that read like a real account
+    return (
+        f"During {situation}, the suspect appeared {emotion} and {action}. "
+        f"When questioned about the reasons, he said he {motive}; "
+        "at times his voice wavered and he seemed uncertain about some details. "
+        "Officers noted changes in his tone and body language, "
+        "which suggested complexity in his motives and emotions."
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_generator(events):
+    """Compile a statement generator specialized for a fixed event count.
+
+    The emitted function inlines intro + ``events`` event paragraphs +
+    closing as one literal list, so repeated calls with the same count (the
+    common case in corpus pipelines) skip the range loop and per-call list
+    building. Compiled once per distinct count and cached.
+    """
+    parts = ["rng.choice(_INTRO_TEMPLATES)"]
+    parts += ["_event_paragraph(rng)"] * events
+    parts.append("rng.choice(_CLOSING_TEMPLATES)")
+    source = "def g(rng):\n    return '\\n\\n'.join([%s]) + '\\n\\n'" % ", ".join(parts)
+    namespace = {
+        "_INTRO_TEMPLATES": _INTRO_TEMPLATES,
+        "_CLOSING_TEMPLATES": _CLOSING_TEMPLATES,
+        "_event_paragraph": _event_paragraph,
+    }
+    exec(source, namespace)
+    return namespace["g"]
 
 
 def generate_synthetic_criminal_statement(events=2, seed=None):
@@ -11,82 +90,51 @@ def generate_synthetic_criminal_statement(events=2, seed=None):
       - Closing paragraph (reflection/summary)
 
     This produces a more realistic single-statement multi-paragraph text instead of many short
-    disconnected paragraphs.
+    disconnected paragraphs. Delegates to a generator specialized (and cached)
+    per event count; seeded output is unchanged.
+    """
+    return _make_generator(events)(random.Random(seed))
+
+
+def generate_many(n, events=2, seed=None):
+    """Generate ``n`` statements in one batch.
+
+    All random selections are pulled up front with ``random.choices`` (one
+    C-level draw per list instead of one ``random.choice`` per field per
+    event), which is noticeably faster when producing training corpora in a
+    tight loop. Returns a list of statements.
     """
     if seed is not None:
         random.seed(seed)
 
-    emotions = ["angry", "anxious", "calm", "nervous", "remorseful", "defensive", "distraught"]
-    actions = [
-        "shouted at the officer",
-        "refused to cooperate",
-        "apologized repeatedly",
-        "blamed his partner",
-        "explained the plan calmly",
-        "avoided eye contact",
-        "sobbed quietly",
-    ]
-    motives = [
-        "needed money",
-        "wanted revenge",
-        "acted impulsively",
-        "was pressured by peers",
-        "was afraid of consequences",
-        "wanted recognition",
-        "felt cornered",
+    total = n * events
+    sits = random.choices(_SITUATIONS, k=total)
+    emos = random.choices(_EMOTIONS, k=total)
+    acts = random.choices(_ACTIONS, k=total)
+    mots = random.choices(_MOTIVES, k=total)
+    intros = random.choices(_INTRO_TEMPLATES, k=n)
+    closings = random.choices(_CLOSING_TEMPLATES, k=n)
+
+    event_paragraphs = [
+        f"During {s}, the suspect appeared {e} and {a}. "
+        f"When questioned about the reasons, he said he {m}; "
+        "at times his voice wavered and he seemed uncertain about some details. "
+        "Officers noted changes in his tone and body language, "
+        "which suggested complexity in his motives and emotions."
+        for s, e, a, m in zip(sits, emos, acts, mots)
     ]
 
-    situations = [
-        "the interrogation room",
-        "the transport after arrest",
-        "when shown the evidence",
-        "the courtroom hallway",
-        "the holding cell",
+    return [
+        "\n\n".join(
+            [intros[i]] + event_paragraphs[i * events:(i + 1) * events] + [closings[i]]
+        ) + "\n\n"
+        for i in range(n)
     ]
 
-    # Intro
-    intro_templates = [
-        "The following is the recorded statement given by the suspect during questioning.",
-        "The suspect provided the following account over the course of the interview.",
-        "Below is a summary of the suspect's remarks captured during the interview session.",
-    ]
-    intro = random.choice(intro_templates)
-
-    paragraphs = [intro]
-
-    # Event paragraphs (cohesive, with multiple sentences each)
-    for i in range(events):
-        situation = random.choice(situations)
-        emotion = random.choice(emotions)
-        action = random.choice(actions)
-        motive = random.choice(motives)
-
-        # Build a few sentences that read like a real account
-        sent1 = f"During {situation}, the suspect appeared {emotion} and {action}."
-        sent2 = (
-            f"When questioned about the reasons, he said he {motive}; "
-            "at times his voice wavered and he seemed uncertain about some details."
-        )
-        sent3 = (
-            "Officers noted changes in his tone and body language, "
-            "which suggested complexity in his motives and emotions."
-        )
-
-        paragraph = " ".join([sent1, sent2, sent3])
-        paragraphs.append(paragraph)
-
-    # Closing paragraph
-    closing_templates = [
-        "The tone of the suspect's voice and body language suggested complex emotions throughout.",
-        "Overall, the suspect's account contained inconsistencies and signs of stress.",
-        "The recorded account was logged and appended to the case file for further review.",
-    ]
-    paragraphs.append(random.choice(closing_templates))
-
-    return "\n\n".join(paragraphs) + "\n\n"
-
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate a cohesive synthetic criminal statement")
     parser.add_argument("--events", "-e", type=int, default=2, help="Number of event paragraphs to include")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
@@ -1,10 +1,135 @@
 import re
-import networkx as nx
-from pyvis.network import Network
-import json
-import webbrowser
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 
+# Compiled once at import so the per-sentence loop doesn't pay for repeated
+# pattern compilation/cache lookups.
+_SIT_RE = re.compile(r"[Dd]uring\s+([^,.;]+)[,\.]")
+_SIT_FALLBACK_RE = re.compile(r"\b(when|while|in)\s+([^,.;]+)[,\.]", re.I)
+_APPEARED_RE = re.compile(r"appeared\s+(\w+)", re.I)
+_SEEMED_RE = re.compile(r"\b(seemed|was)\s+(\w+)\b", re.I)
+_SAID_RE = re.compile(r"(?:said|mentioned) (?:that )?(?:he|the suspect)\s+([^.;,]+)", re.I)
+
+# Keywords lists (mirror generator choices but tolerant)
+_EMOTION_WORDS = ["angry", "anxious", "calm", "nervous", "remorseful", "defensive", "distraught"]
+_ACTION_PHRASES = [
+    "shouted at the officer",
+    "refused to cooperate",
+    "apologized repeatedly",
+    "blamed his partner",
+    "explained the plan calmly",
+    "avoided eye contact",
+    "sobbed quietly",
+]
+_MOTIVE_PHRASES = [
+    "needed money",
+    "wanted revenge",
+    "acted impulsively",
+    "was pressured by peers",
+    "was afraid of consequences",
+    "wanted recognition",
+    "felt cornered",
+]
+
+# Intern the fixed vocabulary so dedup-key tuples built from it hash and
+# compare by pointer equality.
+_EMOTION_WORDS[:] = map(sys.intern, _EMOTION_WORDS)
+_ACTION_PHRASES[:] = map(sys.intern, _ACTION_PHRASES)
+_MOTIVE_PHRASES[:] = map(sys.intern, _MOTIVE_PHRASES)
+
+# Lowercased once at import; matched against a single text.lower() pass so
+# phrase hits are caseless like the emotion/motive regexes.
+_ACTION_PHRASES_LC = [p.lower() for p in _ACTION_PHRASES]
+_MOTIVE_PHRASES_LC = [p.lower() for p in _MOTIVE_PHRASES]
+
+# Color scheme and hover titles are fixed per node type; build them once at
+# import rather than per visualization.
+_COLOR_MAP = {
+    'Statement': '#7C88FF',  # Bright blue
+    'Situation': '#FFB86C',  # Soft orange
+    'Emotion': '#50FA7B',    # Neon green
+    'Action': '#FF5555',     # Soft red
+    'Motive': '#BD93F9'      # Purple
+}
+_NODE_TITLES = {t: f"Type: {t}<br>Click to expand/collapse" for t in _COLOR_MAP}
+
+
+def _sentence_spans(text):
+    """Single linear scan producing (start, end) sentence spans.
+
+    Replaces the lookbehind split regex: a sentence ends at '.', '!' or '?'
+    followed by whitespace, and the next one starts at the next
+    non-whitespace character. No backtracking, no intermediate copies.
+    """
+    spans = []
+    n = len(text)
+    start = 0
+    i = 0
+    while i < n:
+        if text[i] in '.!?' and i + 1 < n and text[i + 1].isspace():
+            if text[start:i + 1].strip():
+                spans.append((start, i + 1))
+            i += 1
+            while i < n and text[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    if start < n and text[start:].strip():
+        spans.append((start, n))
+    return spans
+
+
+def _bucket_phrase_hits(text, starts, phrases):
+    """Scan the whole text once per phrase and record, per sentence, the
+    lowest phrase index that hits it (or None).
+
+    Each phrase is searched with a single C-level ``str.find`` walk over the
+    full text. Only the lowest index per sentence is kept because that is all
+    the window aggregation ever consumes; phrases are visited in list order,
+    so the first assignment wins.
+    """
+    hits = [None] * len(starts)
+    for pi, p in enumerate(phrases):
+        o = text.find(p)
+        while o != -1:
+            si = bisect_right(starts, o) - 1
+            if hits[si] is None:
+                hits[si] = pi
+            o = text.find(p, o + 1)
+    return hits
+
+
+def _bucket_regex_hits(text, starts, pattern):
+    """All matches of ``pattern`` over the full text, bucketed by the index of
+    the sentence containing the match start.
+
+    Restarts one character past each match start so hits a window-local search
+    would have found inside an earlier match are not skipped. Matches arrive
+    in start order, so keeping the first per sentence keeps the leftmost —
+    the only one the window aggregation can use.
+    """
+    hits = [None] * len(starts)
+    m = pattern.search(text)
+    while m:
+        si = bisect_right(starts, m.start()) - 1
+        if hits[si] is None:
+            hits[si] = m
+        m = pattern.search(text, m.start() + 1)
+    return hits
+
+
+def _first_hit(hits, window_sents):
+    """Leftmost match in the window: the first sentence with a hit holds it,
+    since per-sentence candidates are already leftmost."""
+    for s in window_sents:
+        if hits[s] is not None:
+            return hits[s]
+    return None
+
+
 def extract_entities(statement_text):
     """
     Heuristic extraction for multi-paragraph, realistic statements.
@@ -16,38 +141,46 @@ def extract_entities(statement_text):
       - Create one "statement" per event-like window when at least two entity types are found.
 
     This is intentionally lightweight (rule-based) so it doesn't add heavy NLP deps.
+    Results are memoized, so re-processing the same text (e.g. iterative graph
+    rebuilds) skips the scan entirely.
     """
+    return [
+        {'situation': s, 'emotion': e, 'action': a, 'motive': m}
+        for s, e, a, m in _extract_entities_cached(statement_text)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _extract_entities_cached(statement_text):
+    """Scan the text and return events as a tuple of (situation, emotion,
+    action, motive) tuples — hashable, so lru_cache can hold them."""
     entities = []
 
-    # Sentence split (keeps punctuation)
-    sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', statement_text.strip()) if s.strip()]
-
-    # Keywords lists (mirror generator choices but tolerant)
-    emotion_words = ["angry", "anxious", "calm", "nervous", "remorseful", "defensive", "distraught"]
-    action_phrases = [
-        "shouted at the officer",
-        "refused to cooperate",
-        "apologized repeatedly",
-        "blamed his partner",
-        "explained the plan calmly",
-        "avoided eye contact",
-        "sobbed quietly",
-    ]
-    motive_phrases = [
-        "needed money",
-        "wanted revenge",
-        "acted impulsively",
-        "was pressured by peers",
-        "was afraid of consequences",
-        "wanted recognition",
-        "felt cornered",
-    ]
+    text = statement_text.strip()
+
+    # Sentence split (keeps punctuation); spans let phrase hits on the full
+    # text map back to sentence indices.
+    spans = _sentence_spans(text)
+    starts = [s for s, _ in spans]
+
+    # One full-text pass per phrase and per pattern, bucketed by sentence,
+    # instead of re-running every search on every window below.
+    text_lc = text.lower()
+    action_hits = _bucket_phrase_hits(text_lc, starts, _ACTION_PHRASES_LC)
+    motive_hits = _bucket_phrase_hits(text_lc, starts, _MOTIVE_PHRASES_LC)
+    sit_hits = _bucket_regex_hits(text, starts, _SIT_RE)
+    sit_fb_hits = _bucket_regex_hits(text, starts, _SIT_FALLBACK_RE)
+    appeared_hits = _bucket_regex_hits(text, starts, _APPEARED_RE)
+    seemed_hits = _bucket_regex_hits(text, starts, _SEEMED_RE)
+    said_hits = _bucket_regex_hits(text, starts, _SAID_RE)
 
     seen = set()
 
-    for i in range(len(sentences)):
-        # Combine up to 3 sentences to capture context
-        window = ' '.join(sentences[i:i+3])
+    n = len(spans)
+    for i in range(n):
+        # Aggregate the precomputed hits for a window of up to 3 consecutive
+        # sentences; no text is re-scanned here.
+        window_sents = range(i, min(i + 3, n))
 
         situation = None
         emotion = None
@@ -55,93 +188,170 @@ def extract_entities(statement_text):
         motive = None
 
         # Situation: look for 'During <X>,' or 'During <X>.' or 'During <X> the' patterns
-        sit_match = re.search(r"[Dd]uring\s+([^,.;]+)[,\.]", window)
+        sit_match = _first_hit(sit_hits, window_sents)
         if sit_match:
             situation = sit_match.group(1).strip()
         else:
             # fallback: when/while
-            sit_match = re.search(r"\b(when|while|in)\s+([^,.;]+)[,\.]", window, flags=re.I)
+            sit_match = _first_hit(sit_fb_hits, window_sents)
             if sit_match:
                 situation = sit_match.group(2).strip()
 
         # Emotion
-        emo_match = re.search(r"appeared\s+(\w+)", window, flags=re.I)
-        if emo_match and emo_match.group(1).lower() in emotion_words:
+        emo_match = _first_hit(appeared_hits, window_sents)
+        if emo_match and emo_match.group(1).lower() in _EMOTION_WORDS:
             emotion = emo_match.group(1).lower()
         else:
             # look for 'seemed X' or 'was X'
-            emo_match = re.search(r"\b(seemed|was)\s+(\w+)\b", window, flags=re.I)
-            if emo_match and emo_match.group(2).lower() in emotion_words:
+            emo_match = _first_hit(seemed_hits, window_sents)
+            if emo_match and emo_match.group(2).lower() in _EMOTION_WORDS:
                 emotion = emo_match.group(2).lower()
 
-        # Action - look for known action phrases
-        for a in action_phrases:
-            if a in window:
-                action = a
-                break
-
-        # Motive - look for explicit phrasings
-        for m in motive_phrases:
-            if m in window:
-                motive = m
-                break
+        # Action/motive - first known phrase (in list order) hit in the window
+        pi = min((action_hits[s] for s in window_sents
+                  if action_hits[s] is not None), default=None)
+        if pi is not None:
+            action = _ACTION_PHRASES[pi]
+
+        pi = min((motive_hits[s] for s in window_sents
+                  if motive_hits[s] is not None), default=None)
+        if pi is not None:
+            motive = _MOTIVE_PHRASES[pi]
         if not motive:
             # look for 'said he <...>' or 'mentioned he <...>'
-            m_match = re.search(r"(?:said|mentioned) (?:that )?(?:he|the suspect)\s+([^.;,]+)", window, flags=re.I)
+            m_match = _first_hit(said_hits, window_sents)
             if m_match:
                 motive_candidate = m_match.group(1).strip()
                 # keep short motives
                 if len(motive_candidate.split()) <= 6:
                     motive = motive_candidate
 
-        # If we found at least two entity types, add as an event
-        found = {k: v for k, v in [('situation', situation), ('emotion', emotion), ('action', action), ('motive', motive)] if v}
-        if len(found) >= 2:
-            key = (situation or '') + '||' + (emotion or '') + '||' + (action or '') + '||' + (motive or '')
+        # If we found at least two entity types, add as an event. One bit per
+        # type; mask & (mask - 1) is non-zero iff at least two bits are set,
+        # so no per-window dict gets allocated just to count matches.
+        mask = (bool(situation)
+                | bool(emotion) << 1
+                | bool(action) << 2
+                | bool(motive) << 3)
+        if mask & (mask - 1):
+            key = (situation or '', emotion or '', action or '', motive or '')
             if key not in seen:
                 seen.add(key)
-                entities.append({
-                    'situation': situation or '',
-                    'emotion': emotion or '',
-                    'action': action or '',
-                    'motive': motive or ''
-                })
+                entities.append(key)
+
+    return tuple(entities)
 
-    return entities
 
+def populate_network(net, entities):
+    """Populate the pyvis network directly from the extracted entities.
 
-def build_knowledge_graph(entities):
-    G = nx.DiGraph()
+    This replaces the old intermediate NetworkX DiGraph, which was built only
+    to be iterated once into pyvis: same nodes and edges, one pass, no second
+    graph structure in memory. Nodes and edges are built as plain dicts and
+    bulk-assigned to net.nodes / net.edges, skipping pyvis's per-call option
+    copying and linear dedup scan of its node list.
+    """
+    font = {'color': net.font_color}
+    nodes = {}  # id -> node dict; first insertion wins, like add_node did
+    edges = []
 
     for idx, e in enumerate(entities):
         node_id = f"Statement_{idx+1}"
-        G.add_node(node_id, label="Statement")
-        G.add_node(e["situation"], label="Situation")
-        G.add_node(e["emotion"], label="Emotion")
-        G.add_node(e["action"], label="Action")
-        G.add_node(e["motive"], label="Motive")
+        nodes[node_id] = {
+            'id': node_id,
+            'label': f"Statement {idx+1}",
+            'shape': 'dot',
+            'color': _COLOR_MAP['Statement'],
+            'title': _NODE_TITLES['Statement'],
+            'size': 25,
+            'mass': 2,
+            'hidden': False,  # Only root nodes visible initially
+            'font': font,
+        }
 
-        G.add_edge(node_id, e["situation"], relation="happened_during")
-        G.add_edge(node_id, e["emotion"], relation="showed_emotion")
-        G.add_edge(node_id, e["action"], relation="performed_action")
-        G.add_edge(node_id, e["motive"], relation="had_motive")
+        for value, node_type, relation in (
+            (e["situation"], 'Situation', "happened_during"),
+            (e["emotion"], 'Emotion', "showed_emotion"),
+            (e["action"], 'Action', "performed_action"),
+            (e["motive"], 'Motive', "had_motive"),
+        ):
+            if not value:
+                # entity windows only need 2 of the 4 types; skip the empties
+                continue
+            if value not in nodes:
+                nodes[value] = {
+                    'id': value,
+                    'label': value,
+                    'shape': 'dot',
+                    'color': _COLOR_MAP[node_type],
+                    'title': _NODE_TITLES[node_type],
+                    'size': 20,
+                    'mass': 1,
+                    'hidden': True,
+                    'font': font,
+                }
+            edges.append({
+                'from': node_id,
+                'to': value,
+                'arrows': 'to',
+                'title': relation,
+                'color': {'color': 'rgba(255, 255, 255, 0.2)'},
+                'smooth': {'type': 'continuous'},
+            })
 
-    return G
+    net.nodes = list(nodes.values())
+    net.node_ids = list(nodes)
+    net.edges = edges
 
 
-def create_dynamic_network():
-    # Create a network with physics enabled
-    net = Network(
-        height="750px",
-        width="100%",
-        bgcolor="#282a36",
-        font_color="#f8f8f2",
-        directed=True
-    )
-    
-    # Configure physics for continuous random motion
-    physics = {
-        "enabled": True,
+# vis.js options are constant, so the JSON is frozen at module scope instead
+# of being rebuilt and json.dumps'd on every call. Physics keeps continuous
+# random motion: stabilization off, low minVelocity, small adaptive timestep.
+_NET_OPTIONS_JSON = """\
+{
+    "nodes": {
+        "shape": "dot",
+        "borderWidth": 2,
+        "borderWidthSelected": 3,
+        "size": 25,
+        "color": {
+            "border": "#2b2b2b",
+            "background": "#97c2fc"
+        },
+        "font": {
+            "size": 14,
+            "color": "#f8f8f2"
+        },
+        "shadow": {
+            "enabled": true
+        }
+    },
+    "edges": {
+        "color": {
+            "color": "rgba(255, 255, 255, 0.2)",
+            "highlight": "#ffffff"
+        },
+        "width": 1,
+        "smooth": {
+            "type": "continuous"
+        },
+        "arrows": {
+            "to": {
+                "enabled": true,
+                "scaleFactor": 0.5
+            }
+        },
+        "shadow": {
+            "enabled": true
+        }
+    },
+    "interaction": {
+        "hover": true,
+        "navigationButtons": true,
+        "keyboard": true
+    },
+    "physics": {
+        "enabled": true,
         "solver": "barnesHut",
         "barnesHut": {
             "gravitationalConstant": -2000,
@@ -151,96 +361,41 @@ def create_dynamic_network():
             "damping": 0.09,
             "avoidOverlap": 1
         },
-        "minVelocity": 0.1,  # Lower minimum velocity to allow continued motion
-        "maxVelocity": 10,    # Limit maximum velocity for smoother motion
+        "minVelocity": 0.1,
+        "maxVelocity": 10,
         "stabilization": {
-            "enabled": False  # Disable stabilization to allow continuous motion
-        },
-        "timestep": 0.2,     # Smaller timestep for smoother motion
-        "adaptiveTimestep": True
-    }
-    
-    # Configure other options
-    options = {
-        "nodes": {
-            "shape": "dot",
-            "borderWidth": 2,
-            "borderWidthSelected": 3,
-            "size": 25,
-            "color": {
-                "border": "#2b2b2b",
-                "background": "#97c2fc"
-            },
-            "font": {"size": 14, "color": "#f8f8f2"},
-            "shadow": {"enabled": True}
-        },
-        "edges": {
-            "color": {"color": "rgba(255, 255, 255, 0.2)", "highlight": "#ffffff"},
-            "width": 1,
-            "smooth": {"type": "continuous"},
-            "arrows": {"to": {"enabled": True, "scaleFactor": 0.5}},
-            "shadow": {"enabled": True}
-        },
-        "interaction": {
-            "hover": True,
-            "navigationButtons": True,
-            "keyboard": True
+            "enabled": false
         },
-        "physics": physics
+        "timestep": 0.2,
+        "adaptiveTimestep": true
     }
-    
-    net.set_options(json.dumps(options))
+}
+"""
+
+
+def create_dynamic_network():
+    # Imported here so callers that only need extract_entities skip the
+    # visualization stack entirely.
+    from pyvis.network import Network
+
+    # Create a network with physics enabled
+    net = Network(
+        height="750px",
+        width="100%",
+        bgcolor="#282a36",
+        font_color="#f8f8f2",
+        directed=True
+    )
+
+    net.set_options(_NET_OPTIONS_JSON)
     return net
 
-def visualize_graph(G):
-    # Create dynamic network
+
+def visualize_graph(entities):
+    # Create dynamic network and fill it straight from the entities
     net = create_dynamic_network()
-    
-    # Color scheme
-    color_map = {
-        'Statement': '#7C88FF',  # Bright blue
-        'Situation': '#FFB86C',  # Soft orange
-        'Emotion': '#50FA7B',    # Neon green
-        'Action': '#FF5555',     # Soft red
-        'Motive': '#BD93F9'      # Purple
-    }
-    
-    # Add nodes
-    for node, data in G.nodes(data=True):
-        node_type = data.get('label', 'Unknown')
-        is_root = node_type == 'Statement'
-        
-        # Calculate size based on connections
-        size = 25 if is_root else 20
-        
-        # Format a friendly label for statement nodes so they show their number
-        if isinstance(node, str) and node.startswith("Statement_"):
-            parts = node.split("_", 1)
-            label_text = f"{parts[0]} {parts[1]}" if len(parts) > 1 else node
-        else:
-            label_text = node
-
-        # Add node with custom properties
-        net.add_node(
-            node,
-            label=label_text,
-            color=color_map.get(node_type, '#FFFFFF'),
-            title=f"Type: {node_type}<br>Click to expand/collapse",
-            size=size,
-            mass=2 if is_root else 1,
-            hidden=not is_root  # Only root nodes visible initially
-        )
-    
-    # Add edges with custom styling
-    for source, target, data in G.edges(data=True):
-        net.add_edge(
-            source,
-            target,
-            title=data.get('relation', ''),
-            color={'color': 'rgba(255, 255, 255, 0.2)'},
-            smooth={'type': 'continuous'}
-        )
-    
+    populate_network(net, entities)
+
     # Add custom JavaScript for node expansion/collapse
     custom_js = """
     // Function to get connected nodes
@@ -255,8 +410,7 @@ def visualize_graph(G):
     }
     
     // Add random motion to nodes
-    function applyRandomForce() {
-        var nodes = network.body.data.nodes.get();
+    function applyRandomForce(nodes) {
         nodes.forEach(function(node) {
             if (!node.hidden) {
                 var randomAngle = Math.random() * 2 * Math.PI;
@@ -275,12 +429,8 @@ def visualize_graph(G):
         });
     }
     
-    // Continuous random motion
-    setInterval(applyRandomForce, 1000);  // Apply random forces every second
-    
     // Add slight wobble effect
-    function addWobble() {
-        var nodes = network.body.data.nodes.get();
+    function addWobbleStep(nodes) {
         nodes.forEach(function(node) {
             if (!node.hidden) {
                 var wobbleMagnitude = 5;
@@ -297,12 +447,27 @@ def visualize_graph(G):
                 }
             }
         });
-        network.redraw();
-        requestAnimationFrame(addWobble);
     }
     
-    // Start the wobble animation
-    addWobble();
+    // Single animation loop: wobble and redraw at most every 50 ms, random
+    // forces at most once a second, and one nodes.get() per tick shared by
+    // both steps — keeps the main thread idle between ticks.
+    var lastTick = 0;
+    var lastForce = 0;
+    function animate(t) {
+        if (t - lastTick > 50) {
+            var nodes = network.body.data.nodes.get();
+            if (t - lastForce > 1000) {
+                applyRandomForce(nodes);
+                lastForce = t;
+            }
+            addWobbleStep(nodes);
+            network.redraw();
+            lastTick = t;
+        }
+        requestAnimationFrame(animate);
+    }
+    requestAnimationFrame(animate);
     
     // Handle node clicking for expand/collapse
     network.on("click", function(params) {
@@ -339,14 +504,6 @@ def visualize_graph(G):
     });
     """
     
-    # Generate the HTML file
-    html_path = Path.cwd() / "knowledge_graph.html"
-    net.save_graph(str(html_path))
-    
-    # Inject custom CSS for dark theme
-    with open(html_path, 'r') as f:
-        content = f.read()
-    
     dark_theme_css = """
     <style>
         body { background-color: #282a36; margin: 0; }
@@ -357,22 +514,25 @@ def visualize_graph(G):
         }
     </style>
     """
-    
-    content = content.replace('</head>', f'{dark_theme_css}</head>')
-    content = content.replace('</body>', f'<script>{custom_js}</script></body>')
-    
-    with open(html_path, 'w') as f:
-        f.write(content)
-    
+
+    # Render in memory and inject the dark theme CSS and custom JS in one
+    # pass, writing the file a single time (no write/re-read round trip).
+    content = net.generate_html(notebook=False)
+    content = content.replace('</head>', f'{dark_theme_css}</head>', 1)
+    content = content.replace('</body>', f'<script>{custom_js}</script></body>', 1)
+
+    html_path = Path.cwd() / "knowledge_graph.html"
+    html_path.write_text(content, encoding='utf-8')
+
     # Open in browser
+    import webbrowser
     webbrowser.open(f'file://{html_path}')
 
 
 if __name__ == "__main__":
-    with open("criminal_statement.txt", "r") as f:
+    with open("criminal_statement.txt", "r", encoding="utf-8") as f:
         text = f.read()
 
     entities = extract_entities(text)
-    G = build_knowledge_graph(entities)
-    visualize_graph(G)
+    visualize_graph(entities)
     print("✅ Graph generated and displayed.")